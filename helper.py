@@ -1,20 +1,156 @@
 import os
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
 import time
 import shutil
-import stat
-import subprocess
+import tempfile
+import sys
 import logging
 import json
-from datetime import datetime
+import functools
+import importlib.util
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import RotatingFileHandler
+
+# orjson decodes the store's JSON noticeably faster, but it's optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Number of DLC detail requests sent to the Steam store at once
+DLC_FETCH_WORKERS = 8
+# Number of games inspected at once while scanning the libraries
+SCAN_WORKERS = 16
+
+# One pooled session for every HTTP call so connections and TLS sessions are reused.
+# Rate limits and transient server errors are retried with backoff, honouring Retry-After.
+SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False),
+)
+SESSION.mount('https://', _HTTP_ADAPTER)
+SESSION.mount('http://', _HTTP_ADAPTER)
+SESSION.headers['User-Agent'] = 'creamlinux-installer'
+REQUEST_TIMEOUT = (3, 10)
+# Downloads stay in memory up to this size and spill over to a temporary file beyond it
+DOWNLOAD_SPOOL_SIZE = 8 * 1024 * 1024
+
+class _RateLimiter:
+    """Sliding window limiter, only blocks once max_calls have been made within period seconds"""
+    def __init__(self, max_calls, period):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) >= self.max_calls:
+                time.sleep(self.period - (now - self._calls.popleft()))
+            self._calls.append(time.monotonic())
+
+# The Steam store allows roughly 200 appdetails requests per 5 minutes
+_STORE_RATE_LIMITER = _RateLimiter(200, 300)
+
+# Steam store appdetails responses are cached on disk, DLC names rarely change
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'creamlinux-installer')
+APPDETAILS_CACHE_DIR = os.path.join(CACHE_DIR, 'appdetails')
+APPDETAILS_CACHE_TTL = 30 * 24 * 60 * 60
+# Parsed appmanifest fields, keyed by path and reused while the file's mtime and size are unchanged
+ACF_CACHE_PATH = os.path.join(CACHE_DIR, 'acf_cache.json')
+
+# The appmanifest keys we need, matched in a single pass regardless of their order
+_ACF_FIELD_RE = re.compile(rb'"(appid|name|installdir)"\s+"([^"]+)"')
+# A VDF token is either a quoted string (which may contain escaped quotes) or a block brace
+_VDF_TOKEN_RE = re.compile(rb'"((?:[^"\\]|\\.)*)"|([{}])')
+_REG_INSTALL_RE = re.compile(rb'"InstallPath"\s*"([^"]+)"')
+
+# Steam tools and runtimes that show up as installed apps but aren't games
+_EXCLUDED_APP_IDS = frozenset({
+    '228980',  # Steamworks Common Redistributables
+    '1070560', # Steam Linux Runtime
+    '1391110', # Steam Linux Runtime - Soldier
+    '1628350', # Steam Linux Runtime - Sniper
+    '1493710', # Proton Experimental
+    '1826330'  # Steam Linux Runtime - Scout
+})
+_EXCLUDED_NAME_RE = re.compile(r'Proton \d+\.\d+|Steam Linux Runtime|Steamworks Common', re.IGNORECASE)
+
+# DLLs that SmokeAPI replaces in Proton games
+_STEAM_API_NAMES = frozenset({'steam_api.dll', 'steam_api64.dll'})
+
+# cream_installer.log is rotated once it reaches LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT old files
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# What the scan found out about one installed game, the values of find_steam_apps' dict
+GameInfo = namedtuple('GameInfo', 'name cream_status install_path needs_proton steam_api_files smoke_status')
+
+def _backup_path(api_path):
+    """Path SmokeAPI expects the original Steam API DLL at, steam_api.dll -> steam_api_o.dll"""
+    root, ext = os.path.splitext(api_path)
+    return root + '_o' + ext
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+
+@functools.lru_cache(maxsize=1)
+def _read_config():
+    """
+    Read config.json once per process, creating it with the defaults if it doesn't exist.
+    Returns: (config, created)
+    """
+    try:
+        with open(CONFIG_PATH, 'r') as f:
+            return json.load(f), False
+    except FileNotFoundError:
+        default_config = {
+            "version": "v1.0.8",
+            "github_repo": "Novattz/creamlinux-installer",
+            "github_api": "https://api.github.com/repos/",
+            "creamlinux_release": "https://github.com/anticitizn/creamlinux/releases/latest/download/creamlinux.zip",
+            "smokeapi_release": "acidicoala/SmokeAPI",
+        }
+        with open(CONFIG_PATH, 'w') as f:
+            json.dump(default_config, f, indent=4)
+        return default_config, True
+
+@functools.lru_cache(maxsize=None)
+def _find_steam_binary():
+    """Find Steam binary location, PATH doesn't change while we run so it's only looked up once"""
+    steam_path = shutil.which('steam')
+    if steam_path:
+        return os.path.dirname(steam_path)
+    return None
+
+def _valid_acf_entry(entry):
+    """Whether an acf_cache.json entry has the [mtime_ns, size, app_id, name, installdir] shape we write"""
+    return (
+        isinstance(entry, list) and len(entry) == 5
+        and all(type(value) is int for value in entry[:2])
+        and isinstance(entry[2], str)
+        and all(value is None or isinstance(value, str) for value in entry[3:])
+    )
 
 class SteamHelper:
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, use_cache=True):
         self.debug = debug
+        self.use_cache = use_cache
         self.logger = None
         self.config = None
+        # Proton check results keyed by (install_path, mtime_ns), reused by rescans within a session
+        self._proton_cache = {}
         # Only setup logging if debug is enabled - errors will setup logging on-demand
         if debug:
             self._setup_logging()
@@ -22,45 +158,33 @@ class SteamHelper:
 
     def load_config(self):
         """Load configuration from config.json"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        config_path = os.path.join(script_dir, 'config.json')
-        
-        # Create default config if it doesn't exist
-        if not os.path.exists(config_path):
-            default_config = {
-                "version": "v1.0.8",
-                "github_repo": "Novattz/creamlinux-installer",
-                "github_api": "https://api.github.com/repos/",
-                "creamlinux_release": "https://github.com/anticitizn/creamlinux/releases/latest/download/creamlinux.zip",
-                "smokeapi_release": "acidicoala/SmokeAPI",
-            }
-            with open(config_path, 'w') as f:
-                json.dump(default_config, f, indent=4)
-            self.config = default_config
-            if self.debug:
-                self._log_debug("Created default config.json")
-            return
-        
         try:
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
-                if self.debug:
-                    self._log_debug(f"Loaded config: {self.config}")
+            config, created = _read_config()
         except Exception as e:
             self._log_error(f"Failed to load config: {str(e)}")
             raise
-
-    def _cleanup_old_logs(self, log_dir, keep_logs=5):
-        """Clean up old log files, keeping only the most recent ones"""
+        # Each helper gets its own copy, the cached dict is shared by the whole process
+        self.config = dict(config)
+        if created:
+            self._log_debug("Created default config.json")
+        else:
+            self._log_debug("Loaded config: %s", self.config)
+
+    def save_config(self):
+        """Write config.json, skipped when nothing changed since it was loaded or last saved"""
+        saved_config, _ = _read_config()
+        if self.config == saved_config:
+            return
         try:
-            log_files = [os.path.join(log_dir, f) for f in os.listdir(log_dir) 
-                        if f.endswith('.log')]
-            if len(log_files) > keep_logs:
-                log_files.sort(key=lambda x: os.path.getmtime(x))
-                for f in log_files[:-keep_logs]:
-                    os.remove(f)
-        except Exception:
-            pass  # Silently fail cleanup since this is not critical
+            with open(CONFIG_PATH, 'w') as f:
+                json.dump(self.config, f, indent=4)
+        except OSError as e:
+            self._log_error(f"Failed to save config: {str(e)}")
+            raise
+        # Keep the process-wide copy in step with the file instead of re-reading it
+        saved_config.clear()
+        saved_config.update(self.config)
+        self._log_debug("Saved config.json")
 
     def _setup_logging(self):
         """Setup logging to file with detailed formatting"""
@@ -68,11 +192,11 @@ class SteamHelper:
         log_dir = os.path.join(script_dir, 'logs')
         os.makedirs(log_dir, exist_ok=True)
         
-        self._cleanup_old_logs(log_dir)
-        
-        log_file = os.path.join(log_dir, f'cream_installer_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+        log_file = os.path.join(log_dir, 'cream_installer.log')
         
-        file_handler = logging.FileHandler(log_file)
+        # Sessions append to one file that is rotated by size, so the log directory
+        # never has to be listed and pruned on startup
+        file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG if self.debug else logging.ERROR)
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s'
@@ -90,15 +214,16 @@ class SteamHelper:
             self.logger.debug("=== Session Started ===")
             self.logger.debug(f"Debug mode enabled - Log file: {log_file}")
             self.logger.debug(f"System: {os.uname().sysname if hasattr(os, 'uname') else os.name}")
-            self.logger.debug(f"Python version: {subprocess.check_output(['python', '--version']).decode().strip()}")
+            self.logger.debug("Python version: %s", sys.version.split()[0])
             self.logger.debug("Checking for Steam installation...")
 
-    def _log_debug(self, message):
-        """Log debug message if debug mode is enabled"""
-        if self.debug and not self.logger:
+    def _log_debug(self, message, *args, **kwargs):
+        """Log debug message if debug mode is enabled, %-style args are only formatted when it is"""
+        if not self.debug:
+            return
+        if not self.logger:
             self._setup_logging()
-        if self.logger:
-            self.logger.debug(message)
+        self.logger.debug(message, *args, **kwargs)
 
     def _log_error(self, message):
         """Log error message, setting up logging if needed"""
@@ -112,18 +237,18 @@ class SteamHelper:
         missing_packages = []
         
         # Check commands
-        required_commands = ['which', 'steam']
+        # shutil.which does its own PATH lookup, so which(1) itself isn't needed
+        required_commands = ['steam']
         for cmd in required_commands:
-            if not subprocess.run(['which', cmd], capture_output=True).returncode == 0:
+            if shutil.which(cmd) is None:
                 missing_commands.append(cmd)
                 self._log_error(f"Required command not found: {cmd}")
                 
         # Check packages
-        required_packages = ['requests', 'argparse', 'rich', 'json']
+        # find_spec only locates the package, it doesn't import it
+        required_packages = ['requests', 'rich']
         for package in required_packages:
-            try:
-                __import__(package)
-            except ImportError:
+            if importlib.util.find_spec(package) is None:
                 missing_packages.append(package)
                 self._log_error(f"Required Python package not found: {package}")
 
@@ -145,63 +270,70 @@ class SteamHelper:
 
     def _is_excluded_app(self, app_id, name):
         """Check if the app should be excluded from the game list"""
-        excluded_ids = {
-            '228980',  # Steamworks Common Redistributables
-            '1070560', # Steam Linux Runtime
-            '1391110', # Steam Linux Runtime - Soldier
-            '1628350', # Steam Linux Runtime - Sniper
-            '1493710', # Proton Experimental
-            '1826330'  # Steam Linux Runtime - Scout
-        }
-        excluded_patterns = [
-            r'Proton \d+\.\d+',
-            r'Steam Linux Runtime',
-            r'Steamworks Common'
-        ]
-        
-        if app_id in excluded_ids:
-            return True
-            
-        for pattern in excluded_patterns:
-            if re.match(pattern, name, re.IGNORECASE):
-                return True
-                
-        return False
+        return app_id in _EXCLUDED_APP_IDS or _EXCLUDED_NAME_RE.match(name) is not None
 
     def _read_steam_registry(self):
         """Read Steam registry file"""
         registry_path = os.path.expanduser('~/.steam/registry.vdf')
         if os.path.exists(registry_path):
             self._log_debug(f"Found Steam registry file: {registry_path}")
-            with open(registry_path, 'r') as f:
+            with open(registry_path, 'rb') as f:
                 content = f.read()
-                install_path = re.search(r'"InstallPath"\s*"([^"]+)"', content)
+                install_path = _REG_INSTALL_RE.search(content)
                 if install_path:
-                    return install_path.group(1)
+                    return os.fsdecode(install_path.group(1))
         return None
 
     def _parse_vdf(self, file_path):
-        """Parse Steam library folders VDF file"""
+        """
+        Parse Steam library folders VDF file. Only libraryfolders -> <n> -> path is picked up,
+        along with the older libraryfolders -> <n> -> "<path>" layout
+        """
         library_paths = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
+            with open(file_path, 'rb') as file:
                 content = file.read()
-                paths = re.findall(r'"path"\s*"(.*?)"', content, re.IGNORECASE)
-                library_paths.extend([os.path.normpath(path) for path in paths])
+            blocks = []  # Lowercased keys of the enclosing blocks
+            key = None
+            for match in _VDF_TOKEN_RE.finditer(content):
+                string, brace = match.groups()
+                if brace == b'{':
+                    blocks.append((key or b'').lower())
+                    key = None
+                elif brace == b'}':
+                    if blocks:
+                        blocks.pop()
+                    key = None
+                elif key is None:
+                    key = string
+                else:
+                    if blocks[:1] == [b'libraryfolders']:
+                        if (len(blocks) == 2 and blocks[1].isdigit() and key.lower() == b'path') or \
+                                (len(blocks) == 1 and key.isdigit()):
+                            library_paths.append(os.path.normpath(os.fsdecode(string)))
+                    key = None
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self._log_error(f"Failed to read {file_path}: {str(e)}")
         return library_paths
 
-    def _find_steam_binary(self):
-        """Find Steam binary location"""
-        try:
-            result = subprocess.run(['which', 'steam'], stdout=subprocess.PIPE)
-            steam_path = result.stdout.decode('utf-8').strip()
-            if steam_path:
-                return os.path.dirname(steam_path)
-        except Exception as e:
-            self._log_error(f"Failed to locate steam binary: {str(e)}")
-        return None
+    def _iter_search_paths(self, search_list):
+        """
+        Yield the candidate Steam paths, the binary and registry lookups only run
+        if the well-known locations didn't already turn up a library
+        """
+        yield from dict.fromkeys(search_list)
+
+        steam_binary_path = _find_steam_binary()
+        if steam_binary_path and steam_binary_path not in search_list:
+            self._log_debug("Found Steam binary at: %s", steam_binary_path)
+            yield steam_binary_path
+
+        steam_install_path = self._read_steam_registry()
+        if steam_install_path and steam_install_path not in search_list:
+            self._log_debug("Found Steam installation path in registry: %s", steam_install_path)
+            yield steam_install_path
 
     def find_steam_library_folders(self, manual_path=""):
         """Find all Steam library folders"""
@@ -219,143 +351,320 @@ class SteamHelper:
         ]
 
         library_folders = []
+        # Real paths of the library folders found so far, ~/.steam/steam is usually a symlink
+        # to another entry in the search list and would otherwise be scanned twice
+        seen_folders = set()
         try:
             if manual_path:
-                self._log_debug(f"Manual game path provided: {manual_path}")
+                self._log_debug("Manual game path provided: %s", manual_path)
                 if os.path.exists(manual_path):
                     self._log_debug("Manual path exists, adding to library folders")
                     library_folders.append(manual_path)
                 else:
-                    self._log_debug(f"Manual path does not exist: {manual_path}")
+                    self._log_debug("Manual path does not exist: %s", manual_path)
                 return library_folders
 
-            steam_binary_path = self._find_steam_binary()
-            if steam_binary_path:
-                self._log_debug(f"Found Steam binary at: {steam_binary_path}")
-                if steam_binary_path not in search_list:
-                    search_list.append(steam_binary_path)
-
-            steam_install_path = self._read_steam_registry()
-            if steam_install_path:
-                self._log_debug(f"Found Steam installation path in registry: {steam_install_path}")
-                if steam_install_path not in search_list:
-                    search_list.append(steam_install_path)
-
             self._log_debug("Searching for Steam library folders in all potential locations")
-            for search_path in search_list:
-                self._log_debug(f"Checking path: {search_path}")
-                if os.path.exists(search_path):
-                    steamapps_path = str(os.path.normpath(f"{search_path}/steamapps"))
-                    if os.path.exists(steamapps_path):
-                        self._log_debug(f"Found valid steamapps folder: {steamapps_path}")
-                        library_folders.append(steamapps_path)
-
-                        vdf_path = os.path.join(steamapps_path, 'libraryfolders.vdf')
-                        if os.path.exists(vdf_path):
-                            self._log_debug(f"Found libraryfolders.vdf at: {vdf_path}")
-                            additional_paths = self._parse_vdf(vdf_path)
-                            for path in additional_paths:
-                                new_steamapps_path = os.path.join(path, 'steamapps')
-                                if os.path.exists(new_steamapps_path):
-                                    self._log_debug(f"Found additional library folder: {new_steamapps_path}")
-                                    library_folders.append(new_steamapps_path)
-
-            self._log_debug(f"Found {len(library_folders)} total library folders")
+            for search_path in self._iter_search_paths(search_list):
+                self._log_debug("Checking path: %s", search_path)
+                steamapps_path = str(os.path.normpath(f"{search_path}/steamapps"))
+                if not os.path.isdir(steamapps_path):
+                    continue
+                real_steamapps_path = os.path.realpath(steamapps_path)
+                if real_steamapps_path in seen_folders:
+                    continue
+                seen_folders.add(real_steamapps_path)
+                self._log_debug("Found valid steamapps folder: %s", steamapps_path)
+                library_folders.append(steamapps_path)
+
+                vdf_path = os.path.join(steamapps_path, 'libraryfolders.vdf')
+                additional_paths = self._parse_vdf(vdf_path)
+                for path in additional_paths:
+                    new_steamapps_path = os.path.join(path, 'steamapps')
+                    if not os.path.isdir(new_steamapps_path):
+                        continue
+                    real_new_steamapps_path = os.path.realpath(new_steamapps_path)
+                    if real_new_steamapps_path not in seen_folders:
+                        seen_folders.add(real_new_steamapps_path)
+                        self._log_debug("Found additional library folder: %s", new_steamapps_path)
+                        library_folders.append(new_steamapps_path)
+
+                # libraryfolders.vdf lists every library of this Steam install, no need to keep looking
+                if additional_paths:
+                    self._log_debug("Using library folders from %s", vdf_path)
+                    break
+
+            self._log_debug("Found %s total library folders", len(library_folders))
             for folder in library_folders:
-                self._log_debug(f"Library folder: {folder}")
+                self._log_debug("Library folder: %s", folder)
 
         except Exception as e:
             self._log_error(f"Error finding Steam library folders: {e}")
-            self._log_debug(f"Stack trace:", exc_info=True)
+            self._log_debug("Stack trace:", exc_info=True)
         return library_folders
 
     def _parse_acf(self, file_path):
         """Parse Steam ACF file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
+            with open(file_path, 'rb') as file:
                 data = file.read()
-            app_id = re.search(r'"appid"\s+"(\d+)"', data)
-            name = re.search(r'"name"\s+"([^"]+)"', data)
-            install_dir = re.search(r'"installdir"\s+"([^"]+)"', data)
-            return app_id.group(1), name.group(1), install_dir.group(1)
+            fields = {}
+            for match in _ACF_FIELD_RE.finditer(data):
+                # The first occurrence is the top-level key, nested blocks come after it
+                fields.setdefault(match.group(1), match.group(2))
+                if len(fields) == 3:
+                    break
+            return fields[b'appid'].decode('utf-8'), fields[b'name'].decode('utf-8'), fields[b'installdir'].decode('utf-8')
         except Exception as e:
             self._log_error(f"Error reading ACF file {file_path}: {e}")
             return None, None, None
 
-    def _check_proton_status(self, install_path):
+    def _walk_files(self, top, top_entries=None):
+        """
+        Walk a directory tree with os.scandir, yielding (root, file_names) per directory.
+        Entry types come from the directory listing itself, so no extra stat is needed
+        per entry. Symlinked directories are not followed, same as os.walk.
+        top_entries can pass in an existing listing of top so it isn't read twice.
+        """
+        stack = [top]
+        while stack:
+            root = stack.pop()
+            files = []
+            try:
+                if root is top and top_entries is not None:
+                    entries = top_entries
+                else:
+                    with os.scandir(root) as it:
+                        entries = list(it)
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.name)
+            except OSError:
+                continue
+            yield root, files
+
+    def _check_proton_status(self, install_path, top_entries=None):
         """
         Check if a game requires Proton by looking for .exe files and Steam API DLLs
         Returns: (needs_proton, steam_api_files)
         """
+        try:
+            cache_key = (install_path, os.stat(install_path).st_mtime_ns)
+        except OSError:
+            cache_key = None
+        if cache_key in self._proton_cache:
+            return self._proton_cache[cache_key]
+
         try:
             has_exe = False
             steam_api_files = []
-            steam_api_patterns = ['steam_api.dll', 'steam_api64.dll']
-            
-            for root, _, files in os.walk(install_path):
-                # Check for .exe files
-                if not has_exe and any(file.lower().endswith('.exe') for file in files):
-                    has_exe = True
-                
-                # Check for Steam API files
+
+            for root, files in self._walk_files(install_path, top_entries):
                 for file in files:
-                    if file.lower() in steam_api_patterns:
+                    file_lower = file.lower()
+                    # Check for Steam API files, then for .exe files
+                    if file_lower in _STEAM_API_NAMES:
                         steam_api_files.append(os.path.relpath(os.path.join(root, file), install_path))
-                
+                    elif not has_exe and file_lower.endswith('.exe'):
+                        has_exe = True
+
                 # If we found both, we can stop searching
                 if has_exe and steam_api_files:
                     break
-            
+
+            if cache_key:
+                self._proton_cache[cache_key] = (has_exe, steam_api_files)
             return has_exe, steam_api_files
             
         except Exception as e:
             self._log_error(f"Error checking Proton status: {e}")
             return False, []
 
+    def _load_acf_cache(self):
+        """
+        Load the parsed appmanifest cache. An unreadable cache is rebuilt and malformed
+        entries are dropped, their manifests are simply parsed again.
+        """
+        if not self.use_cache:
+            return {}
+        try:
+            with open(ACF_CACHE_PATH, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {path: entry for path, entry in cache.items() if _valid_acf_entry(entry)}
+
+    def _process_manifest(self, entry, common_prefix, install_dirs, acf_cache, new_acf_cache):
+        """
+        Parse one appmanifest and inspect the game it points to
+        Returns: (app_id, GameInfo), or None if it isn't an installed game
+        """
+        try:
+            acf_stat = entry.stat()
+        except OSError:
+            return None  # Removed while scanning, e.g. Steam finished uninstalling it
+        cached = acf_cache.get(entry.path)
+        if cached and cached[0] == acf_stat.st_mtime_ns and cached[1] == acf_stat.st_size:
+            app_id, game_name, install_dir = cached[2:]
+        else:
+            app_id, game_name, install_dir = self._parse_acf(entry.path)
+        if app_id:
+            new_acf_cache[entry.path] = [acf_stat.st_mtime_ns, acf_stat.st_size, app_id, game_name, install_dir]
+        if not (app_id and game_name and install_dir in install_dirs) or self._is_excluded_app(app_id, game_name):
+            return None
+
+        install_path = common_prefix + install_dir
+        # The game's top-level listing answers the cream.sh check and seeds the Proton walk
+        try:
+            with os.scandir(install_path) as it:
+                top_entries = list(it)
+        except OSError:
+            top_entries = []
+        cream_installed = any(top_entry.name == 'cream.sh' for top_entry in top_entries)
+        needs_proton, steam_api_files = self._check_proton_status(install_path, top_entries)
+        smoke_installed = self.check_smokeapi_status(install_path, steam_api_files) if needs_proton else False
+
+        # One record per game, games are scanned concurrently and separate lines would interleave
+        self._log_debug(
+            "Found game: %s (App ID: %s)\n  Path: %s\n  Status: Cream=%s, Proton=%s, Smoke=%s\n  Steam API files: %s",
+            game_name, app_id, install_path, cream_installed, needs_proton, smoke_installed, steam_api_files
+        )
+
+        return app_id, GameInfo(
+            name=game_name,
+            cream_status=cream_installed,
+            install_path=install_path,
+            needs_proton=needs_proton,
+            steam_api_files=steam_api_files,
+            smoke_status=smoke_installed
+        )
+
     def find_steam_apps(self, library_folders):
         """Find all Steam apps in library folders"""
         self._log_debug("Starting Steam apps search")
-        acf_pattern = re.compile(r'^appmanifest_(\d+)\.acf$')
         games = {}
-        
-        for folder in library_folders:
-            self._log_debug(f"Searching for games in: {folder}")
-            if os.path.exists(folder):
-                for item in os.listdir(folder):
-                    if acf_pattern.match(item):
-                        app_id, game_name, install_dir = self._parse_acf(os.path.join(folder, item))
-                        if app_id and game_name and not self._is_excluded_app(app_id, game_name):
-                            install_path = os.path.join(folder, 'common', install_dir)
-                            if os.path.exists(install_path):
-                                cream_installed = os.path.exists(os.path.join(install_path, 'cream.sh'))
-                                needs_proton, steam_api_files = self._check_proton_status(install_path)
-                                smoke_installed = self.check_smokeapi_status(install_path, steam_api_files) if needs_proton else False
-                                
-                                games[app_id] = (
-                                    game_name,           # [0] Name
-                                    cream_installed,     # [1] CreamLinux status
-                                    install_path,        # [2] Install path
-                                    needs_proton,        # [3] Proton status
-                                    steam_api_files,     # [4] Steam API files
-                                    smoke_installed      # [5] SmokeAPI status
-                                )
-                                
-                                self._log_debug(f"Found game: {game_name} (App ID: {app_id})")
-                                self._log_debug(f"  Path: {install_path}")
-                                self._log_debug(f"  Status: Cream={cream_installed}, Proton={needs_proton}, Smoke={smoke_installed}")
-                                if steam_api_files:
-                                    self._log_debug(f"  Steam API files: {', '.join(steam_api_files)}")
-        
+        acf_cache = self._load_acf_cache()
+        # Entries of libraries outside this scan, e.g. with --manual, are kept as they are,
+        # those of the scanned libraries are rebuilt so removed manifests fall out
+        scanned_folders = {os.path.normpath(folder) for folder in library_folders}
+        new_acf_cache = {
+            path: entry for path, entry in acf_cache.items()
+            if os.path.dirname(os.path.normpath(path)) not in scanned_folders
+        }
+
+        # Listing the libraries is cheap, the per-game reads and directory walks are what
+        # is worth overlapping, across games and across the drives the libraries live on
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            futures = []
+            for folder in library_folders:
+                self._log_debug("Searching for games in: %s", folder)
+                common_prefix = os.path.join(folder, 'common', '')
+                try:
+                    # One listing of common/ answers the install dir check for every game in this library
+                    with os.scandir(common_prefix) as it:
+                        install_dirs = {entry.name for entry in it if entry.is_dir()}
+                except OSError:
+                    install_dirs = set()
+
+                try:
+                    with os.scandir(folder) as it:
+                        for entry in it:
+                            # Cheap string checks first, most entries in steamapps aren't manifests
+                            name = entry.name
+                            if not (name.startswith('appmanifest_') and name.endswith('.acf')):
+                                continue
+                            if not name[12:-4].isdigit() or not entry.is_file():
+                                continue
+                            futures.append(executor.submit(
+                                self._process_manifest, entry, common_prefix, install_dirs, acf_cache, new_acf_cache
+                            ))
+                except FileNotFoundError:
+                    self._log_debug("Library folder does not exist: %s", folder)
+
+            # Collect in submission order so a later library still wins on duplicate app ids
+            for future in futures:
+                result = future.result()
+                if result:
+                    app_id, game_info = result
+                    games[app_id] = game_info
+
+        if new_acf_cache != acf_cache:
+            self._write_cache(ACF_CACHE_PATH, new_acf_cache)
+
         self._log_debug(f"Found {len(games)} total games")
         return games
 
+    def _write_cache(self, cache_path, data):
+        """Write a JSON cache file atomically so an interrupted run never leaves a truncated file"""
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            self._log_debug(f"Failed to write cache file {cache_path}: {str(e)}")
+
+    def _get_appdetails(self, app_id):
+        """
+        Get the Steam store appdetails response for an app, using the on-disk cache when possible
+        Returns: (status_code, data)
+        """
+        cache_path = os.path.join(APPDETAILS_CACHE_DIR, f"{app_id}.json")
+        cached = None
+        if self.use_cache:
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached = _json_loads(f.read())
+                if time.time() - os.path.getmtime(cache_path) < APPDETAILS_CACHE_TTL:
+                    self._log_debug("Using cached appdetails for %s", app_id)
+                    return 200, cached
+            except (OSError, ValueError):
+                pass
+
+        _STORE_RATE_LIMITER.wait()
+        response = SESSION.get(f"https://store.steampowered.com/api/appdetails?appids={app_id}&filters=basic", timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            # Serve a stale copy rather than nothing when rate limited or the store is down
+            if cached is not None and (response.status_code == 429 or response.status_code >= 500):
+                self._log_debug("Store returned HTTP %s, using stale cache for %s", response.status_code, app_id)
+                return 200, cached
+            return response.status_code, None
+
+        try:
+            data = _json_loads(response.content)
+        except ValueError as e:
+            # An HTML error page or an empty body, treated like a failed request
+            self._log_error(f"Invalid appdetails response for {app_id}: {str(e)}")
+            return response.status_code, None
+        self._write_cache(cache_path, data)
+        return 200, data
+
+    def _fetch_dlc(self, dlc_id):
+        """Fetch the name of a single DLC, returns None if it could not be fetched"""
+        try:
+            status_code, dlc_data = self._get_appdetails(dlc_id)
+            if status_code == 200 and dlc_data and str(dlc_id) in dlc_data and "data" in dlc_data[str(dlc_id)]:
+                dlc_name = dlc_data[str(dlc_id)]["data"].get("name", "Unknown DLC")
+                return {"appid": dlc_id, "name": dlc_name}
+        except Exception as e:
+            self._log_error(f"Error fetching DLC {dlc_id}: {str(e)}")
+        return None
+
     def fetch_dlc_details(self, app_id, progress_callback=None):
         """Fetch DLC details for a game"""
-        base_url = f"https://store.steampowered.com/api/appdetails?appids={app_id}"
         try:
-            response = requests.get(base_url)
-            data = response.json()
-            if str(app_id) not in data:
+            _, data = self._get_appdetails(app_id)
+            if not data or str(app_id) not in data:
                 return []
                 
             app_data = data[str(app_id)]
@@ -364,72 +673,64 @@ class SteamHelper:
             
             game_data = app_data['data']
             dlcs = game_data.get("dlc", [])
-            dlc_details = []
-            
+            results = [None] * len(dlcs)
+
             total_dlcs = len(dlcs)
-            for index, dlc_id in enumerate(dlcs):
-                try:
-                    time.sleep(0.3)
-                    dlc_url = f"https://store.steampowered.com/api/appdetails?appids={dlc_id}"
-                    dlc_response = requests.get(dlc_url)
-                    
-                    if dlc_response.status_code == 200:
-                        dlc_data = dlc_response.json()
-                        if str(dlc_id) in dlc_data and "data" in dlc_data[str(dlc_id)]:
-                            dlc_name = dlc_data[str(dlc_id)]["data"].get("name", "Unknown DLC")
-                            dlc_details.append({"appid": dlc_id, "name": dlc_name})
-                    elif dlc_response.status_code == 429:
-                        time.sleep(10)
-                        
+            completed = 0
+            with ThreadPoolExecutor(max_workers=DLC_FETCH_WORKERS) as executor:
+                futures = {executor.submit(self._fetch_dlc, dlc_id): index for index, dlc_id in enumerate(dlcs)}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    completed += 1
                     if progress_callback:
-                        progress_callback(index + 1, total_dlcs)
-                        
-                except Exception as e:
-                    self._log_error(f"Error fetching DLC {dlc_id}: {str(e)}")
-                    
-            return dlc_details
-            
+                        progress_callback(completed, total_dlcs)
+
+            # Keep the order the store lists the DLCs in
+            return [dlc for dlc in results if dlc]
+
         except requests.exceptions.RequestException as e:
             self._log_error(f"Failed to fetch DLC details: {str(e)}")
             return []
 
+    def _download(self, url, name):
+        """Stream a download into a spooled temporary file, it is never written next to the game"""
+        with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code != 200:
+                raise InstallationError(f"Failed to download {name} (HTTP {response.status_code})")
+            zip_buffer = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE)
+            for chunk in response.iter_content(chunk_size=65536):
+                zip_buffer.write(chunk)
+        zip_buffer.seek(0)
+        return zip_buffer
+
     def install_creamlinux(self, app_id, game_install_dir, dlcs):
         """Install CreamLinux for a game"""
         try:
             zip_url = self.config['creamlinux_release']
-            zip_path = os.path.join(game_install_dir, 'creamlinux.zip')
-            
-            self._log_debug(f"Downloading CreamLinux from {zip_url}")
-            response = requests.get(zip_url)
-            if response.status_code != 200:
-                raise InstallationError(f"Failed to download CreamLinux (HTTP {response.status_code})")
 
-            self._log_debug(f"Writing zip file to {zip_path}")
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            self._log_debug(f"Downloading CreamLinux from {zip_url}")
+            zip_buffer = self._download(zip_url, "CreamLinux")
 
             self._log_debug("Extracting CreamLinux files")
             try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                with zip_buffer, zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
                     zip_ref.extractall(game_install_dir)
             except zipfile.BadZipFile:
                 raise InstallationError("Downloaded file is corrupted. Please try again.")
 
-            os.remove(zip_path)
-            
             cream_sh_path = os.path.join(game_install_dir, 'cream.sh')
             self._log_debug(f"Setting permissions for {cream_sh_path}")
             try:
-                os.chmod(cream_sh_path, os.stat(cream_sh_path).st_mode | stat.S_IEXEC)
+                os.chmod(cream_sh_path, 0o755)
             except OSError as e:
                 raise InstallationError(f"Failed to set execute permissions: {str(e)}")
             
             cream_api_path = os.path.join(game_install_dir, 'cream_api.ini')
             self._log_debug(f"Creating config at {cream_api_path}")
             try:
-                dlc_list = "\n".join([f"{dlc['appid']} = {dlc['name']}" for dlc in dlcs])
                 with open(cream_api_path, 'w') as f:
-                    f.write(f"APPID = {app_id}\n[config]\nissubscribedapp_on_false_use_real = true\n[methods]\ndisable_steamapps_issubscribedapp = false\n[dlc]\n{dlc_list}")
+                    f.write(f"APPID = {app_id}\n[config]\nissubscribedapp_on_false_use_real = true\n[methods]\ndisable_steamapps_issubscribedapp = false\n[dlc]\n")
+                    f.writelines(f"{dlc['appid']} = {dlc['name']}\n" for dlc in dlcs)
             except IOError as e:
                 raise InstallationError(f"Failed to create config file: {str(e)}")
             
@@ -445,9 +746,10 @@ class SteamHelper:
         try:
             files_to_remove = ['cream.sh', 'cream_api.ini', 'cream_api.so', 'lib32Creamlinux.so', 'lib64Creamlinux.so']
             for file in files_to_remove:
-                file_path = os.path.join(install_path, file)
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+                try:
+                    os.remove(os.path.join(install_path, file))
+                except FileNotFoundError:
+                    pass
             return True
         except Exception as e:
             self._log_error(f"Uninstallation failed: {str(e)}")
@@ -457,8 +759,9 @@ class SteamHelper:
         """Install SmokeAPI for a Proton game"""
         try:
             # Construct the correct URL using latest version
-            response = requests.get(
-                f"{self.config['github_api']}{self.config['smokeapi_release']}/releases/latest"
+            response = SESSION.get(
+                f"{self.config['github_api']}{self.config['smokeapi_release']}/releases/latest",
+                timeout=REQUEST_TIMEOUT
             )
             if response.status_code != 200:
                 raise InstallationError("Failed to fetch latest SmokeAPI version")
@@ -470,27 +773,20 @@ class SteamHelper:
                 f"{latest_version}/SmokeAPI-{latest_version}.zip"
             )
             
-            zip_path = os.path.join(install_path, 'smokeapi.zip')
-            
             self._log_debug(f"Downloading SmokeAPI from {zip_url}")
-            response = requests.get(zip_url)
-            if response.status_code != 200:
-                raise InstallationError(f"Failed to download SmokeAPI (HTTP {response.status_code})")
-
-            self._log_debug(f"Writing zip file to {zip_path}")
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            zip_buffer = self._download(zip_url, "SmokeAPI")
 
             self._log_debug("Extracting SmokeAPI files")
             try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                with zip_buffer, zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
+                    # Games often ship the same DLL in several places, decompress each one only once
+                    api_data = {}
                     for api_file in steam_api_files:
-                        api_dir = os.path.dirname(os.path.join(install_path, api_file))
                         api_name = os.path.basename(api_file)
                         
                         # Backup original file
-                        original_path = os.path.join(api_dir, api_name)
-                        backup_path = os.path.join(api_dir, api_name.replace('.dll', '_o.dll'))
+                        original_path = os.path.join(install_path, api_file)
+                        backup_path = _backup_path(original_path)
                         
                         self._log_debug(f"Processing {api_file}:")
                         self._log_debug(f"  Original: {original_path}")
@@ -500,15 +796,17 @@ class SteamHelper:
                         if not os.path.exists(backup_path):
                             shutil.move(original_path, backup_path)
                         
-                        # Extract the appropriate DLL directly to the game directory
-                        zip_ref.extract(api_name, api_dir)
+                        # Write the appropriate DLL directly to the game directory
+                        if api_name not in api_data:
+                            api_data[api_name] = zip_ref.read(api_name)
+                        with open(original_path, 'wb') as f:
+                            f.write(api_data[api_name])
                         
                         self._log_debug(f"  Installed SmokeAPI as: {original_path}")
                         
             except zipfile.BadZipFile:
                 raise InstallationError("Downloaded file is corrupted. Please try again.")
 
-            os.remove(zip_path)
             return True
             
         except Exception as e:
@@ -519,17 +817,15 @@ class SteamHelper:
         """Uninstall SmokeAPI and restore original files"""
         try:
             for api_file in steam_api_files:
-                api_dir = os.path.dirname(os.path.join(install_path, api_file))
-                api_name = os.path.basename(api_file)
-                
-                original_path = os.path.join(api_dir, api_name)
-                backup_path = os.path.join(api_dir, api_name.replace('.dll', '_o.dll'))
+                original_path = os.path.join(install_path, api_file)
+                backup_path = _backup_path(original_path)
                 
-                if os.path.exists(backup_path):
-                    if os.path.exists(original_path):
-                        os.remove(original_path)
-                    shutil.move(backup_path, original_path)
-                    self._log_debug(f"Restored original file: {original_path}")
+                # os.replace swaps the backup over the SmokeAPI DLL in one rename
+                try:
+                    os.replace(backup_path, original_path)
+                except FileNotFoundError:
+                    continue
+                self._log_debug(f"Restored original file: {original_path}")
                 
             return True
             
@@ -540,15 +836,7 @@ class SteamHelper:
     def check_smokeapi_status(self, install_path, steam_api_files):
         """Check if SmokeAPI is installed"""
         try:
-            for api_file in steam_api_files:
-                backup_path = os.path.join(
-                    install_path, 
-                    os.path.dirname(api_file),
-                    os.path.basename(api_file).replace('.dll', '_o.dll')
-                )
-                if os.path.exists(backup_path):
-                    return True
-            return False
+            return any(os.path.exists(_backup_path(os.path.join(install_path, api_file))) for api_file in steam_api_files)
         except Exception as e:
             self._log_error(f"Error checking SmokeAPI status: {str(e)}")
             return False
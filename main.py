@@ -1,4 +1,5 @@
 import argparse
+import functools
 import os
 from helper import SteamHelper, RequirementsError, NetworkError, InstallationError
 from ui_handler import UIHandler
@@ -22,8 +23,10 @@ def handle_dlc_operation(ui, helper, app_id, game_name, install_dir):
             if success:
                 ui.show_success("Installation complete!")
                 ui.show_launch_options(game_name)
+                return True
     else:
         ui.show_warning("No DLCs found for this game.")
+    return False
 
 def handle_smokeapi_operation(ui, helper, install_path, steam_api_files, game_name, is_install=True):
     """Handle SmokeAPI installation/uninstallation"""
@@ -42,18 +45,35 @@ def handle_smokeapi_operation(ui, helper, install_path, steam_api_files, game_na
             ui.show_success(f"Successfully {'installed' if is_install else 'uninstalled'} SmokeAPI!")
         else:
             ui.show_error(f"Failed to {'install' if is_install else 'uninstall'} SmokeAPI")
+        return success
     except Exception as e:
         ui.show_error(str(e))
+        return False
+
+def library_signature(library_folders):
+    """
+    mtimes of each library and its common/ folder, they change whenever Steam adds, updates
+    or removes a game so comparing signatures tells if a rescan is needed
+    """
+    signature = []
+    for folder in library_folders:
+        for path in (folder, os.path.join(folder, 'common')):
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+    return tuple(signature)
 
 def main():
     parser = argparse.ArgumentParser(description="Steam DLC Fetcher")
     parser.add_argument("--manual", metavar='steamapps_path', help="Sets the steamapps path for faster operation", required=False)
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--no-update", action="store_true", help="Skip update check")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached Steam store and GitHub responses and re-parse all app manifests")
     args = parser.parse_args()
 
     ui = UIHandler(debug=args.debug)
-    helper = SteamHelper(debug=args.debug)
+    helper = SteamHelper(debug=args.debug, use_cache=not args.no_cache)
     
     try:
         if not args.no_update:
@@ -65,9 +85,9 @@ def main():
                 if not ui.get_user_confirmation("Would you like to continue anyway?"):
                     return
         
-        # Use version from config instead of fetching
-        app_version = helper.config['version']
-        ui.show_header(app_version, args.debug)
+        # Use version from config instead of fetching, the header only depends on it and the debug flag
+        show_header = functools.partial(ui.show_header, helper.config['version'], args.debug)
+        show_header()
 
         helper.check_requirements()
     except RequirementsError as e:
@@ -90,24 +110,37 @@ def main():
                     ui.show_error("Invalid path or path does not exist!")
                     return
 
+        rescan = True
+        scanned_signature = None
         while True:
-            # Refresh games list at the start of each loop
-            with ui.create_status_context("Scanning for games..."):
-                games = helper.find_steam_apps(library_folders)
+            # Only rescan the libraries on startup, when Steam changed them or when explicitly
+            # asked to, operations below update the games dict in place
+            signature = library_signature(library_folders)
+            if rescan or signature != scanned_signature:
+                with ui.create_status_context("Scanning for games..."):
+                    games = helper.find_steam_apps(library_folders)
+                # Built once per scan, the table and the selection below only iterate and index it
+                games_list = tuple(games.items())
+                scanned_signature = signature
+                rescan = False
             
             if not games:
                 ui.show_error("No Steam games found.")
                 return
 
-            games_list = list(games.items())
             ui.show_games_table(games_list)
 
             try:
-                ui.console.print("\n[dim]Enter game number or 'q' to quit[/dim]")
+                ui.console.print("\n[dim]Enter game number, 'r' to rescan or 'q' to quit[/dim]")
                 user_input = ui.get_user_input("Select game number")
                 
                 if user_input.lower() == 'q':
                     return
+
+                if user_input.lower() == 'r':
+                    rescan = True
+                    show_header()
+                    continue
                     
                 choice = int(user_input) - 1
                 if not (0 <= choice < len(games_list)):
@@ -115,73 +148,69 @@ def main():
                     continue
                 
                 # Show the selected game and options
-                ui.clear_screen()
-                ui.show_header(app_version, args.debug)
+                show_header()
                 ui.show_games_table(games_list, choice)
                 
-                # Get game's status
-                is_installed = games_list[choice][1][1]  # cream_status
-                needs_proton = games_list[choice][1][3]  # needs_proton
-                steam_api_files = games_list[choice][1][4]  # steam_api_files
-                smoke_status = games_list[choice][1][5]  # smoke_status
-                game_info = (games_list[choice][0], games_list[choice][1])
+                app_id, game = games_list[choice]
                 
                 # Different choices based on installation status and game type
-                if needs_proton and steam_api_files:
-                    if smoke_status:
+                if game.needs_proton and game.steam_api_files:
+                    if game.smoke_status:
                         max_options = 2  # Uninstall and Go Back
                         action = ui.get_user_input("\nChoose action", choices=["1", "2"])
                         
                         if action == "2":  # Go back
-                            ui.clear_screen()
-                            ui.show_header(app_version, args.debug)
+                            show_header()
                             continue
                         
                         if action == "1":  # Uninstall SmokeAPI
-                            handle_smokeapi_operation(ui, helper, game_info[1][2], steam_api_files, game_info[1][0], False)
+                            if handle_smokeapi_operation(ui, helper, game.install_path, game.steam_api_files, game.name, False):
+                                games[app_id] = game._replace(smoke_status=False)
                     else:
                         max_options = 2  # Install and Go Back
                         action = ui.get_user_input("\nChoose action", choices=["1", "2"])
                         
                         if action == "2":  # Go back
-                            ui.clear_screen()
-                            ui.show_header(app_version, args.debug)
+                            show_header()
                             continue
                         
                         if action == "1":  # Install SmokeAPI
-                            handle_smokeapi_operation(ui, helper, game_info[1][2], steam_api_files, game_info[1][0], True)
+                            if handle_smokeapi_operation(ui, helper, game.install_path, game.steam_api_files, game.name, True):
+                                games[app_id] = game._replace(smoke_status=True)
                 else:
                     # Handle non-Proton games (original logic)
-                    if is_installed:
+                    if game.cream_status:
                         action = ui.get_user_input("\nChoose action", choices=["1", "2", "3"])
                         if action == "3":  # Go back
-                            ui.clear_screen()
-                            ui.show_header(app_version, args.debug)
+                            show_header()
                             continue
                         
                         if action == "1":  # Fetch DLCs
-                            handle_dlc_operation(ui, helper, game_info[0], game_info[1][0], game_info[1][2])
+                            handle_dlc_operation(ui, helper, app_id, game.name, game.install_path)
                         else:  # Uninstall
                             if ui.get_user_confirmation("\nAre you sure you want to uninstall CreamLinux?"):
                                 with ui.create_status_context("Uninstalling CreamLinux..."):
-                                    success = helper.uninstall_creamlinux(game_info[1][2])
+                                    success = helper.uninstall_creamlinux(game.install_path)
                                 if success:
-                                    ui.show_success(f"Successfully uninstalled CreamLinux from {game_info[1][0]}")
+                                    games[app_id] = game._replace(cream_status=False)
+                                    ui.show_success(f"Successfully uninstalled CreamLinux from {game.name}")
                                     ui.show_uninstall_reminder()
                     else:
                         action = ui.get_user_input("\nChoose action", choices=["1", "2"])
                         if action == "2":  # Go back
-                            ui.clear_screen()
-                            ui.show_header(app_version, args.debug)
+                            show_header()
                             continue
                         
                         # Proceed with DLC operation
-                        handle_dlc_operation(ui, helper, game_info[0], game_info[1][0], game_info[1][2])
+                        if handle_dlc_operation(ui, helper, app_id, game.name, game.install_path):
+                            games[app_id] = game._replace(cream_status=True)
+
+                # Pick up any status the operation above changed in games
+                games_list = tuple(games.items())
 
                 # After any operation, ask if user wants to continue
                 if ui.get_user_confirmation("\nWould you like to perform another operation?"):
-                    ui.clear_screen()
-                    ui.show_header(app_version, args.debug)
+                    show_header()
                     continue
                 else:
                     break
@@ -6,19 +6,43 @@ from rich.prompt import Prompt, Confirm
 from rich.text import Text
 from rich import box
 
+# Type and Status cells, parsed once instead of on every row of every redraw
+_TYPE_PROTON = Text.from_markup("[blue]Proton[/blue]")
+_TYPE_NATIVE = Text.from_markup("[green]Native[/green]")
+_STATUS_SMOKE_INSTALLED = Text.from_markup("[green]✓ Smoke installed[/green]")
+_STATUS_CREAM_INSTALLED = Text.from_markup("[green]✓ Cream installed[/green]")
+_STATUS_NOT_INSTALLED = Text.from_markup("[yellow]Not Installed[/yellow]")
+
 class UIHandler:
     def __init__(self, debug=False):
         self.console = Console()
         self.debug = debug
+        # Built once, every progress display shares the same columns
+        self._progress_columns = (
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TaskProgressColumn()
+        )
+        # (games_list, rows) of the last games table, the row cells only change with the games
+        self._games_rows = (None, None)
+        # ((app_version, debug_mode), panel) of the header
+        self._header = (None, None)
 
     def clear_screen(self):
         """Clear the console screen"""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Rich writes the ANSI clear sequence itself, no shell or clear(1) process is spawned
+        self.console.clear()
 
     def show_header(self, app_version, debug_mode):
-        """Display the application header"""
+        """Clear the screen and display the application header"""
         self.clear_screen()
+        if self._header[0] != (app_version, debug_mode):
+            self._header = ((app_version, debug_mode), self._build_header(app_version, debug_mode))
+        self.console.print(self._header[1])
+
+    def _build_header(self, app_version, debug_mode):
+        """Header panel, only built once as it's redrawn on every menu change"""
         logo = r"""
   _    _ _   _ _      ____   _____ _  ________ _____  
  | |  | | \ | | |    / __ \ / ____| |/ /  ____|  __ \ 
@@ -33,15 +57,23 @@ class UIHandler:
         if debug_mode:
             info_text += "\n[red][Running in DEBUG mode][/red]"
         
-        self.console.print(
-            Panel.fit(
-                Text.from_markup(f"{logo}\n{info_text}"),
-                style="cyan",
-                border_style="cyan",
-                box=box.ROUNDED,
-            )
+        return Panel.fit(
+            Text.from_markup(f"{logo}\n{info_text}"),
+            style="cyan",
+            border_style="cyan",
+            box=box.ROUNDED,
         )
 
+    def _game_type(self, needs_proton):
+        """Cell for the Type column"""
+        return _TYPE_PROTON if needs_proton else _TYPE_NATIVE
+
+    def _game_status(self, cream_status, needs_proton, smoke_status):
+        """Cell for the Status column, SmokeAPI for Proton games and CreamLinux for native ones"""
+        if needs_proton:
+            return _STATUS_SMOKE_INSTALLED if smoke_status else _STATUS_NOT_INSTALLED
+        return _STATUS_CREAM_INSTALLED if cream_status else _STATUS_NOT_INSTALLED
+
     def show_games_table(self, games_list, selected_idx=None):
         """Display the table of available games"""
         table = Table(show_header=True, header_style="cyan", box=box.ROUNDED)
@@ -50,20 +82,20 @@ class UIHandler:
         table.add_column("Type", style="dim")
         table.add_column("Status")
 
-        for idx, (app_id, (name, cream_status, _, needs_proton, _, smoke_status)) in enumerate(games_list, 1):
-            if needs_proton:
-                status = "[green]✓ Smoke installed[/green]" if smoke_status else "[yellow]Not Installed[/yellow]"
-            else:
-                status = "[green]✓ Cream installed[/green]" if cream_status else "[yellow]Not Installed[/yellow]"
-                
-            game_type = "[blue]Proton[/blue]" if needs_proton else "[green]Native[/green]"
-            
+        if self._games_rows[0] != games_list:
+            self._games_rows = (tuple(games_list), [
+                (f"[bold cyan]{idx}[/bold cyan]", game.name, self._game_type(game.needs_proton),
+                 self._game_status(game.cream_status, game.needs_proton, game.smoke_status))
+                for idx, (_, game) in enumerate(games_list, 1)
+            ])
+
+        for idx, (number, name, game_type, status) in enumerate(self._games_rows[1], 1):
             # Highlight only the game name if selected
             if selected_idx is not None and idx == selected_idx + 1:
                 name = f"[bold white on blue]{name}[/bold white on blue]"
             
             table.add_row(
-                f"[bold cyan]{idx}[/bold cyan]",
+                number,
                 name,
                 game_type,
                 status
@@ -74,37 +106,31 @@ class UIHandler:
         
         if selected_idx is not None:
             # Get selected game details
-            _, (game_name, cream_status, install_path, needs_proton, steam_api_files, smoke_status) = games_list[selected_idx]
-            if needs_proton:
-                status = "[green]✓ Smoke installed[/green]" if smoke_status else "[yellow]Not Installed[/yellow]"
-            else:
-                status = "[green]✓ Cream installed[/green]" if cream_status else "[yellow]Not Installed[/yellow]"
-                
-            game_type = "[blue]Proton[/blue]" if needs_proton else "[green]Native[/green]"
-            app_id = games_list[selected_idx][0]
+            game = games_list[selected_idx][1]
+            _, _, game_type, status = self._games_rows[1][selected_idx]
             
             # Show footer with selected game info
-            self.console.print(f"[dim]Selected: {game_name} (Type: {game_type}) - Status: {status}[/dim]")
+            self.console.print(Text.assemble(f"Selected: {game.name} (Type: ", game_type, ") - Status: ", status, style="dim"))
             
             # Show Steam API files if present for Proton games
-            if needs_proton and steam_api_files:
+            if game.needs_proton and game.steam_api_files:
                 self.console.print("\n[cyan]Steam API files found:[/cyan]")
-                for api_file in steam_api_files:
+                for api_file in game.steam_api_files:
                     self.console.print(f"[dim]- {api_file}[/dim]")
             
             # Show options based on game type and status
             self.console.print("\n[cyan]Selected Game Options:[/cyan]")
             options = []
             
-            if needs_proton and steam_api_files:
-                if smoke_status:
+            if game.needs_proton and game.steam_api_files:
+                if game.smoke_status:
                     options.append("1. Uninstall SmokeAPI")
                     options.append("2. Go Back")
                 else:
                     options.append("1. Install SmokeAPI")
                     options.append("2. Go Back")
             else:
-                if cream_status:
+                if game.cream_status:
                     options.append("1. Fetch DLCs")
                     options.append("2. Uninstall CreamLinux")
                     options.append("3. Go Back")
@@ -132,8 +158,8 @@ class UIHandler:
         self.console.print(Panel.fit(table, title="[bold cyan]📦 Found DLCs[/bold cyan]", border_style="cyan"))
 
     def create_progress_context(self):
-        """Create and return a progress context"""
-        return Progress()
+        """Create and return a progress context, it is cleared from the screen when done"""
+        return Progress(*self._progress_columns, console=self.console, transient=True)
 
     def show_error(self, message, show_exception=False):
         """Display an error message"""
@@ -4,13 +4,58 @@ import shutil
 import requests
 import tempfile
 import subprocess
+import time
+import json
+import hashlib
 from zipfile import ZipFile
-from helper import SteamHelper
+from helper import SteamHelper, CACHE_DIR, DOWNLOAD_SPOOL_SIZE, REQUEST_TIMEOUT, SESSION
+
+# The latest release info is cached so a restart doesn't always hit the GitHub API
+RELEASE_CACHE_PATH = os.path.join(CACHE_DIR, 'latest_release.json')
+RELEASE_CACHE_TTL = 6 * 60 * 60
+# Update packages are downloaded in 1 MiB chunks, 8 KiB reads spent more time in Python than on the wire
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 class UpdateError(Exception):
     """Raised when update operations fail"""
     pass
 
+def get_latest_release(helper, api_url):
+    """Get the latest release info from GitHub, revalidating the cached copy with its ETag once it goes stale"""
+    cached = None
+    if helper.use_cache:
+        try:
+            with open(RELEASE_CACHE_PATH, 'r') as f:
+                cached = json.load(f)
+            if not isinstance(cached, dict) or cached.get('url') != api_url or 'release' not in cached:
+                cached = None
+            elif time.time() - os.path.getmtime(RELEASE_CACHE_PATH) < RELEASE_CACHE_TTL:
+                helper._log_debug("Using cached release info")
+                return cached['release']
+        except (OSError, ValueError):
+            cached = None
+
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+
+    helper._log_debug(f"Fetching from: {api_url}")
+    response = SESSION.get(api_url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        # Unchanged since the last fetch, rewriting the cache restarts its TTL
+        helper._log_debug("Release info not modified, reusing cached copy")
+        helper._write_cache(RELEASE_CACHE_PATH, cached)
+        return cached['release']
+    response.raise_for_status()
+    latest_release = response.json()
+
+    helper._write_cache(RELEASE_CACHE_PATH, {
+        'url': api_url,
+        'etag': response.headers.get('ETag'),
+        'release': latest_release
+    })
+    return latest_release
+
 def check_for_updates(ui_handler, helper):
     """
     Check for updates and handle the update process if needed
@@ -24,10 +69,7 @@ def check_for_updates(ui_handler, helper):
 
         # Get latest release info from GitHub
         api_url = f"{helper.config['github_api']}{helper.config['github_repo']}/releases/latest"
-        helper._log_debug(f"Fetching from: {api_url}")
-        
-        response = requests.get(api_url)
-        latest_release = response.json()
+        latest_release = get_latest_release(helper, api_url)
         latest_version = latest_release['tag_name']
         helper._log_debug(f"Latest version found: {latest_version}")
 
@@ -37,10 +79,6 @@ def check_for_updates(ui_handler, helper):
             
             if ui_handler.get_user_confirmation("Would you like to update?"):
                 perform_update(latest_release, ui_handler, helper)
-                # Update config with new version
-                helper.config['version'] = latest_version
-                helper.save_config()
-                helper._log_debug("Updated config.json with new version")
                 return True
                 
         return False
@@ -50,11 +88,49 @@ def check_for_updates(ui_handler, helper):
         ui_handler.show_warning(f"Failed to check for updates: {str(e)}")
         return False
 
+def backup_file(src, dst):
+    """
+    Back up a file, as a hardlink when possible so no data is copied. Only .py files are linked,
+    they are always replaced through install_file and never written in place, while
+    config.json is rewritten in place by save_config and so gets a real copy.
+    """
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    if src.endswith('.py'):
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # Different filesystem or no hardlink support, fall back to copying
+    shutil.copy2(src, dst)
+
+def install_file(src, dst):
+    """Write a new file next to dst and swap it into place, so dst is never left half written"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            shutil.copyfileobj(src, f, DOWNLOAD_CHUNK_SIZE)
+        try:
+            shutil.copymode(dst, tmp_path)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def perform_update(release_info, ui_handler, helper):
     """Download and install the update"""
     script_path = os.path.abspath(sys.argv[0])
     script_dir = os.path.dirname(script_path)
     helper._log_debug(f"Script directory: {script_dir}")
+    # Only a backup made by this update may be restored, backup/ can be left over from an earlier one
+    backup_created = False
 
     try:
         # Find the asset URL
@@ -67,55 +143,73 @@ def perform_update(release_info, ui_handler, helper):
 
         helper._log_debug(f"Found update package: {zip_asset['name']}")
 
-        # Create temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            helper._log_debug(f"Created temp directory: {temp_dir}")
-            
+        # The package is kept in memory unless it is unusually large, it never needs a path on disk
+        with tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE) as zip_buffer:
             # Download the update
             with ui_handler.create_status_context("Downloading update..."):
-                response = requests.get(zip_asset['browser_download_url'], stream=True)
-                zip_path = os.path.join(temp_dir, 'update.zip')
-                helper._log_debug(f"Downloading to: {zip_path}")
+                response = SESSION.get(zip_asset['browser_download_url'], stream=True, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                helper._log_debug("Downloading update package")
                 
-                with open(zip_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                # Hashed while it streams in, so verifying costs no extra pass over the package
+                digest = hashlib.sha256()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    zip_buffer.write(chunk)
+                zip_buffer.seek(0)
+
+            # GitHub publishes a sha256 digest for release assets, older assets may lack one
+            expected_digest = zip_asset.get('digest') or ''
+            if expected_digest.startswith('sha256:'):
+                if digest.hexdigest() != expected_digest[len('sha256:'):].lower():
+                    helper._log_debug(f"Checksum mismatch, expected {expected_digest}, got sha256:{digest.hexdigest()}")
+                    raise UpdateError("Update package checksum mismatch")
+                helper._log_debug("Update package checksum verified")
+            else:
+                helper._log_debug("No checksum published for the update package, skipping verification")
 
-            # Extract update
+            # Install update
             with ui_handler.create_status_context("Installing update..."):
-                helper._log_debug("Extracting update files")
-                with ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Create backup of current files
-                backup_dir = os.path.join(script_dir, 'backup')
-                os.makedirs(backup_dir, exist_ok=True)
-                helper._log_debug(f"Created backup directory: {backup_dir}")
-                
-                # Copy current files to backup
-                for file in os.listdir(script_dir):
-                    if file.endswith('.py') or file == 'config.json':
-                        helper._log_debug(f"Backing up: {file}")
-                        shutil.copy2(
-                            os.path.join(script_dir, file),
-                            os.path.join(backup_dir, file)
-                        )
-
-                # Copy new files
-                for file in os.listdir(temp_dir):
-                    if file.endswith('.py'):
-                        helper._log_debug(f"Installing new file: {file}")
-                        shutil.copy2(
-                            os.path.join(temp_dir, file),
-                            os.path.join(script_dir, file)
-                        )
+                helper._log_debug("Reading update package")
+                with ZipFile(zip_buffer, 'r') as zip_ref:
+                    # Only the top-level .py files of the package are installed
+                    new_files = [
+                        info for info in zip_ref.infolist()
+                        if '/' not in info.filename and info.filename.endswith('.py')
+                    ]
+
+                    # Create backup of current files
+                    backup_dir = os.path.join(script_dir, 'backup')
+                    # Start from an empty backup/, files left by an earlier update must never be restored
+                    shutil.rmtree(backup_dir, ignore_errors=True)
+                    os.makedirs(backup_dir)
+                    helper._log_debug(f"Created backup directory: {backup_dir}")
+                    
+                    # Back up current files
+                    for file in os.listdir(script_dir):
+                        if file.endswith('.py') or file == 'config.json':
+                            helper._log_debug(f"Backing up: {file}")
+                            backup_file(os.path.join(script_dir, file), os.path.join(backup_dir, file))
+                    backup_created = True
+
+                    # Stream new files straight out of the package, nothing is extracted to disk first
+                    for info in new_files:
+                        helper._log_debug(f"Installing new file: {info.filename}")
+                        with zip_ref.open(info) as src:
+                            install_file(src, os.path.join(script_dir, info.filename))
+
+        # Update config with new version, this has to happen here as execl below never returns
+        helper.config['version'] = release_info['tag_name']
+        helper.save_config()
+        helper._log_debug("Updated config.json with new version")
 
         ui_handler.show_success("Update completed successfully!")
         ui_handler.show_info("Restarting application...")
         helper._log_debug("Preparing to restart application")
         
-        # Restart the application
+        # Restart the application in place, it keeps the terminal and the process id the shell waits on.
+        # Buffered output is lost on exec, so flush it first.
+        sys.stdout.flush()
         python = sys.executable
         os.execl(python, python, *sys.argv)
 
@@ -123,14 +217,16 @@ def perform_update(release_info, ui_handler, helper):
         helper._log_error(f"Update failed: {str(e)}")
         # Attempt to restore from backup if available
         backup_dir = os.path.join(script_dir, 'backup')
-        if os.path.exists(backup_dir):
+        if backup_created:
             helper._log_debug("Attempting to restore from backup")
             for file in os.listdir(backup_dir):
+                backup_path = os.path.join(backup_dir, file)
+                target_path = os.path.join(script_dir, file)
+                # A hardlinked backup of a file that was never replaced already is the current file
+                if os.path.exists(target_path) and os.path.samefile(backup_path, target_path):
+                    continue
                 helper._log_debug(f"Restoring: {file}")
-                shutil.copy2(
-                    os.path.join(backup_dir, file),
-                    os.path.join(script_dir, file)
-                )
+                shutil.copy2(backup_path, target_path)
             shutil.rmtree(backup_dir)
             
         raise UpdateError(f"Update failed: {str(e)}")
\ No newline at end of file